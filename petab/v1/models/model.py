@@ -3,18 +3,27 @@
 from __future__ import annotations
 
 import abc
-from collections.abc import Iterable
+import importlib
+from collections.abc import Callable, Iterable, Sequence
+from functools import cache
 from pathlib import Path
 from typing import Any
 
+from . import MODEL_TYPE_PYSB, MODEL_TYPE_SBML
+
 __all__ = ["Model", "model_factory"]
 
+#: Module and name of the `Model` subclass for each supported model language
+_MODEL_CLASSES = {
+    MODEL_TYPE_SBML: (".sbml_model", "SbmlModel"),
+    MODEL_TYPE_PYSB: (".pysb_model", "PySBModel"),
+}
+
 
 class Model(abc.ABC):
     """Base class for wrappers for any PEtab-supported model type"""
 
-    @abc.abstractmethod
-    def __init__(self): ...
+    __slots__ = ("__weakref__",)
 
     def __repr__(self):
         return f"<{self.__class__.__name__} {self.model_id!r}>"
@@ -65,19 +74,19 @@ class Model(abc.ABC):
     @abc.abstractmethod
     def get_free_parameter_ids_with_values(
         self,
-    ) -> Iterable[tuple[str, float]]:
+    ) -> Sequence[tuple[str, float]]:
         """Get free model parameters along with their values
 
         Returns:
-            Iterator over tuples of (parameter_id, parameter_value)
+            Sequence of tuples of (parameter_id, parameter_value)
         """
         ...
 
     @abc.abstractmethod
-    def get_parameter_ids(self) -> Iterable[str]:
+    def get_parameter_ids(self) -> Sequence[str]:
         """Get all parameter IDs from this model
 
-        :returns: Iterator over model parameter IDs
+        :returns: Sequence of model parameter IDs
         """
         ...
 
@@ -93,11 +102,11 @@ class Model(abc.ABC):
         ...
 
     @abc.abstractmethod
-    def get_valid_parameters_for_parameter_table(self) -> Iterable[str]:
+    def get_valid_parameters_for_parameter_table(self) -> Sequence[str]:
         """Get IDs of all parameters that are allowed to occur in the PEtab
         parameters table
 
-        :returns: Iterator over parameter IDs
+        :returns: Sequence of parameter IDs
         """
         ...
 
@@ -150,21 +159,12 @@ def model_factory(
     :param model_id: PEtab model ID for the given model
     :returns: A :py:class:`Model` instance representing the given model
     """
-    from . import MODEL_TYPE_PYSB, MODEL_TYPE_SBML, known_model_types
-
-    if model_language == MODEL_TYPE_SBML:
-        from .sbml_model import SbmlModel
-
-        return SbmlModel.from_file(
+    if (loader := _get_loader(model_language)) is not None:
+        return loader(
             filepath_or_buffer, model_id=model_id, base_path=base_path
         )
 
-    if model_language == MODEL_TYPE_PYSB:
-        from .pysb_model import PySBModel
-
-        return PySBModel.from_file(
-            filepath_or_buffer, model_id=model_id, base_path=base_path
-        )
+    from . import known_model_types
 
     if model_language in known_model_types:
         raise NotImplementedError(
@@ -172,3 +172,21 @@ def model_factory(
         )
 
     raise ValueError(f"Unknown model format: {model_language}")
+
+
+@cache
+def _get_loader(model_language: str) -> Callable[..., Model] | None:
+    """Get the function for loading models of the given language
+
+    The respective model module is imported only on first use.
+
+    :param model_language: PEtab model language ID
+    :returns: The ``from_file`` method of the matching :py:class:`Model`
+        subclass, or ``None`` if the language is not supported
+    """
+    if (model_class := _MODEL_CLASSES.get(model_language)) is None:
+        return None
+
+    module_name, class_name = model_class
+    module = importlib.import_module(module_name, __package__)
+    return getattr(module, class_name).from_file
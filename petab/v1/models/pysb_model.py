@@ -7,17 +7,24 @@ import re
 import sys
 from collections.abc import Iterable
 from pathlib import Path
-from typing import Any
-
-import pysb
+from typing import TYPE_CHECKING, Any
 
 from ..._utils import _generate_path
 from .. import is_valid_identifier
 from . import MODEL_TYPE_PYSB
 from .model import Model
 
+if TYPE_CHECKING:
+    import pysb
+
 __all__ = ["PySBModel", "parse_species_name", "pattern_from_string"]
 
+# A single constituent of a PySB complex species name
+_complex_constituent_pattern = re.compile(
+    r"^(?P<monomer>\w+)\((?P<site_config>.*)\)"
+    r"( \*\* (?P<compartment>.*))?$"
+)
+
 
 def _pysb_model_from_path(pysb_model_file: str | Path) -> pysb.Model:
     """Load a pysb model module and return the :class:`pysb.Model` instance
@@ -25,6 +32,8 @@ def _pysb_model_from_path(pysb_model_file: str | Path) -> pysb.Model:
     :param pysb_model_file: Full or relative path to the PySB model module
     :return: The pysb Model instance
     """
+    import pysb
+
     pysb_model_file = Path(pysb_model_file)
     pysb_model_module_name = pysb_model_file.with_suffix("").name
 
@@ -34,8 +43,19 @@ def _pysb_model_from_path(pysb_model_file: str | Path) -> pysb.Model:
         pysb_model_module_name, pysb_model_file
     )
     module = importlib.util.module_from_spec(spec)
+    # The module needs to be registered while it is executed. PySB derives
+    #  the default model name from the module name.
+    previous_module = sys.modules.get(pysb_model_module_name)
     sys.modules[pysb_model_module_name] = module
-    spec.loader.exec_module(module)
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        # don't leave a broken module behind
+        if previous_module is None:
+            del sys.modules[pysb_model_module_name]
+        else:
+            sys.modules[pysb_model_module_name] = previous_module
+        raise
 
     # find a pysb.Model instance in the module
     # 1) check if module.model exists and is a pysb.Model
@@ -44,8 +64,7 @@ def _pysb_model_from_path(pysb_model_file: str | Path) -> pysb.Model:
         return model
 
     # 2) check if there is any other pysb.Model instance
-    for x in dir(module):
-        attr = getattr(module, x)
+    for attr in vars(module).values():
         if isinstance(attr, pysb.Model):
             return attr
 
@@ -57,6 +76,8 @@ class PySBModel(Model):
 
     type_id = MODEL_TYPE_PYSB
 
+    __slots__ = ("rel_path", "base_path", "model", "_model_id")
+
     def __init__(
         self,
         model: pysb.Model,
@@ -64,8 +85,6 @@ class PySBModel(Model):
         rel_path: Path | str | None = None,
         base_path: str | Path | None = None,
     ):
-        super().__init__()
-
         self.rel_path = rel_path
         self.base_path = base_path
 
@@ -114,8 +133,8 @@ class PySBModel(Model):
     def model_id(self, model_id):
         self._model_id = model_id
 
-    def get_parameter_ids(self) -> Iterable[str]:
-        return (p.name for p in self.model.parameters)
+    def get_parameter_ids(self) -> tuple[str, ...]:
+        return tuple(p.name for p in self.model.parameters)
 
     def get_parameter_value(self, id_: str) -> float:
         try:
@@ -125,17 +144,21 @@ class PySBModel(Model):
 
     def get_free_parameter_ids_with_values(
         self,
-    ) -> Iterable[tuple[str, float]]:
-        return ((p.name, p.value) for p in self.model.parameters)
+    ) -> tuple[tuple[str, float], ...]:
+        return self.get_parameter_ids_with_values()
+
+    def get_parameter_ids_with_values(self) -> tuple[tuple[str, float], ...]:
+        return tuple((p.name, p.value) for p in self.model.parameters)
 
     def has_entity_with_id(self, entity_id) -> bool:
-        try:
-            _ = self.model.components[entity_id]
-            return True
-        except KeyError:
-            return False
+        # look up each component set by name, `Model.components` would
+        #  build a new set of all components on every access
+        return any(
+            component_set.get(entity_id) is not None
+            for component_set in self.model.all_component_sets()
+        )
 
-    def get_valid_parameters_for_parameter_table(self) -> Iterable[str]:
+    def get_valid_parameters_for_parameter_table(self) -> tuple[str, ...]:
         # all parameters are allowed in the parameter table
         return self.get_parameter_ids()
 
@@ -145,9 +168,10 @@ class PySBModel(Model):
         )
 
     def symbol_allowed_in_observable_formula(self, id_: str) -> bool:
-        return id_ in (
-            x.name
-            for x in itertools.chain(
+        # component sets are indexed by name
+        return any(
+            component_set.get(id_) is not None
+            for component_set in (
                 self.model.parameters,
                 self.model.observables,
                 self.model.expressions,
@@ -161,7 +185,7 @@ class PySBModel(Model):
     def is_state_variable(self, id_: str) -> bool:
         # If there is a component with that name, it's not a state variable
         # (there are no dynamically-sized compartments)
-        if self.model.components.get(id_, None):
+        if self.has_entity_with_id(id_):
             return False
 
         # Try parsing the ID
@@ -207,15 +231,11 @@ def parse_species_name(
     if "=MultiState(" in name:
         raise NotImplementedError("MultiState is not yet supported.")
 
-    complex_constituent_pattern = re.compile(
-        r"^(?P<monomer>\w+)\((?P<site_config>.*)\)"
-        r"( \*\* (?P<compartment>.*))?$"
-    )
     result = []
     complex_constituents = name.split(" % ")
 
     for complex_constituent in complex_constituents:
-        match = complex_constituent_pattern.match(complex_constituent)
+        match = _complex_constituent_pattern.match(complex_constituent)
         if not match:
             raise ValueError(
                 f"Invalid species name: '{name}' ('{complex_constituent}')"
@@ -250,6 +270,8 @@ def parse_species_name(
 
 def pattern_from_string(string: str, model: pysb.Model) -> pysb.ComplexPattern:
     """Convert a pattern string to a Pattern instance"""
+    import pysb
+
     parts = parse_species_name(string)
     patterns = []
     for part in parts:
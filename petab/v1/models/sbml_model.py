@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import copy
 import itertools
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from pathlib import Path
+from typing import Any
 
 import libsbml
 import sympy as sp
@@ -22,12 +24,26 @@ from .model import Model
 
 __all__ = ["SbmlModel"]
 
+#: `SbmlModel` attributes that are not copied or pickled as they are
+_TRANSIENT_ATTRIBUTES = frozenset(
+    {"sbml_reader", "sbml_document", "sbml_model"}
+)
+
 
 class SbmlModel(Model):
     """PEtab wrapper for SBML models"""
 
     type_id = MODEL_TYPE_SBML
 
+    __slots__ = (
+        "rel_path",
+        "base_path",
+        "sbml_reader",
+        "sbml_document",
+        "sbml_model",
+        "_model_id",
+    )
+
     def __init__(
         self,
         sbml_model: libsbml.Model = None,
@@ -43,8 +59,6 @@ class SbmlModel(Model):
         :param sbml_reader: SBML reader. Optional.
         :param sbml_document: SBML document. Optional if `sbml_model` is given.
         :param model_id: Model ID. Defaults to the SBML model ID."""
-        super().__init__()
-
         self.rel_path = rel_path
         self.base_path = base_path
 
@@ -65,22 +79,34 @@ class SbmlModel(Model):
 
         self._model_id = model_id or sbml_model.getIdAttribute()
 
+    def _get_attributes(self) -> dict[str, Any]:
+        """Get all instance attributes except for the libsbml objects"""
+        attributes = {
+            name: getattr(self, name)
+            for cls in type(self).__mro__
+            for name in getattr(cls, "__slots__", ())
+            if name not in _TRANSIENT_ATTRIBUTES
+            and name != "__weakref__"
+            and hasattr(self, name)
+        }
+        # attributes of subclasses without __slots__
+        attributes.update(getattr(self, "__dict__", {}))
+        return attributes
+
     def __getstate__(self):
         """Return state for pickling"""
-        state = self.__dict__.copy()
-
         # libsbml stuff cannot be serialized directly
+        state = self._get_attributes()
+
         if self.sbml_model:
             state["sbml_string"] = self.to_sbml_str()
 
-        exclude = ["sbml_reader", "sbml_document", "sbml_model"]
-        for key in exclude:
-            state.pop(key)
-
         return state
 
     def __setstate__(self, state):
         """Set state after unpickling"""
+        self.sbml_reader = self.sbml_document = self.sbml_model = None
+
         # load SBML model from pickled string
         sbml_string = state.pop("sbml_string", None)
         if sbml_string:
@@ -90,7 +116,29 @@ class SbmlModel(Model):
                 self.sbml_model,
             ) = load_sbml_from_string(sbml_string)
 
-        self.__dict__.update(state)
+        for key, value in state.items():
+            setattr(self, key, value)
+
+    def __deepcopy__(self, memo):
+        """Create a deep copy
+
+        The SBML document is copied by libsbml directly, instead of being
+        written to and parsed from a string as for pickling.
+        """
+        result = self.__class__.__new__(self.__class__)
+        memo[id(self)] = result
+
+        for key, value in self._get_attributes().items():
+            setattr(result, key, copy.deepcopy(value, memo))
+
+        result.sbml_reader = result.sbml_document = result.sbml_model = None
+        if self.sbml_model:
+            # a fresh reader, as when loading the model from a string
+            result.sbml_reader = libsbml.SBMLReader()
+            result.sbml_document = self.sbml_model.getSBMLDocument().clone()
+            result.sbml_model = result.sbml_document.getModel()
+
+        return result
 
     @staticmethod
     def from_file(
@@ -177,6 +225,22 @@ class SbmlModel(Model):
             filename or _generate_path(self.rel_path, self.base_path),
         )
 
+    def _get_non_rule_target_parameters(
+        self,
+    ) -> Iterator[tuple[str, libsbml.Parameter]]:
+        """Iterate over all model parameters that are not rule targets
+
+        :returns: Iterator over tuples of (parameter_id, parameter)
+        """
+        rule_targets = {
+            ar.getVariable() for ar in self.sbml_model.getListOfRules()
+        }
+        return (
+            (parameter_id, p)
+            for p in self.sbml_model.getListOfParameters()
+            if (parameter_id := p.getId()) not in rule_targets
+        )
+
     def get_parameter_value(self, id_: str) -> float:
         parameter = self.sbml_model.getParameter(id_)
         if not parameter:
@@ -185,67 +249,47 @@ class SbmlModel(Model):
 
     def get_free_parameter_ids_with_values(
         self,
-    ) -> Iterable[tuple[str, float]]:
-        rule_targets = {
-            ar.getVariable() for ar in self.sbml_model.getListOfRules()
+    ) -> tuple[tuple[str, float], ...]:
+        # collect initial assignments once instead of searching them for
+        #  every parameter
+        initial_assignments = {
+            ia.getSymbol(): ia
+            for ia in self.sbml_model.getListOfInitialAssignments()
         }
 
-        def get_initial(p):
+        def get_initial(parameter_id, p):
             # return the initial assignment value if there is one, and it is a
             # number; `None`, if there is a non-numeric initial assignment;
             # otherwise, the parameter value
-            if ia := self.sbml_model.getInitialAssignmentBySymbol(p.getId()):
-                sym_expr = sympify_sbml(ia.getMath())
-                return (
-                    float(sym_expr.evalf())
-                    if sym_expr.evalf().is_Number
-                    else None
-                )
+            if ia := initial_assignments.get(parameter_id):
+                value = sympify_sbml(ia.getMath()).evalf()
+                return float(value) if value.is_Number else None
             return p.getValue()
 
-        return (
-            (p.getId(), initial)
-            for p in self.sbml_model.getListOfParameters()
-            if p.getId() not in rule_targets
-            and (initial := get_initial(p)) is not None
+        return tuple(
+            (parameter_id, initial)
+            for parameter_id, p in self._get_non_rule_target_parameters()
+            if (initial := get_initial(parameter_id, p)) is not None
         )
 
-    def get_parameter_ids(self) -> Iterable[str]:
-        rule_targets = {
-            ar.getVariable() for ar in self.sbml_model.getListOfRules()
-        }
-
-        return (
-            p.getId()
-            for p in self.sbml_model.getListOfParameters()
-            if p.getId() not in rule_targets
+    def get_parameter_ids(self) -> tuple[str, ...]:
+        return tuple(
+            parameter_id
+            for parameter_id, _ in self._get_non_rule_target_parameters()
         )
 
-    def get_parameter_ids_with_values(self) -> Iterable[tuple[str, float]]:
-        rule_targets = {
-            ar.getVariable() for ar in self.sbml_model.getListOfRules()
-        }
-
-        return (
-            (p.getId(), p.getValue())
-            for p in self.sbml_model.getListOfParameters()
-            if p.getId() not in rule_targets
+    def get_parameter_ids_with_values(self) -> tuple[tuple[str, float], ...]:
+        return tuple(
+            (parameter_id, p.getValue())
+            for parameter_id, p in self._get_non_rule_target_parameters()
         )
 
     def has_entity_with_id(self, entity_id) -> bool:
         return self.sbml_model.getElementBySId(entity_id) is not None
 
-    def get_valid_parameters_for_parameter_table(self) -> Iterable[str]:
+    def get_valid_parameters_for_parameter_table(self) -> tuple[str, ...]:
         # All parameters except rule-targets
-        disallowed_set = {
-            ar.getVariable() for ar in self.sbml_model.getListOfRules()
-        }
-
-        return (
-            p.getId()
-            for p in self.sbml_model.getListOfParameters()
-            if p.getId() not in disallowed_set
-        )
+        return self.get_parameter_ids()
 
     def get_valid_ids_for_condition_table(self) -> Iterable[str]:
         return (
@@ -258,7 +302,9 @@ class SbmlModel(Model):
         )
 
     def symbol_allowed_in_observable_formula(self, id_: str) -> bool:
-        return self.sbml_model.getElementBySId(id_) or id_ == "time"
+        return (
+            self.sbml_model.getElementBySId(id_) is not None or id_ == "time"
+        )
 
     def is_valid(self) -> bool:
         return is_sbml_consistent(self.sbml_model.getSBMLDocument())
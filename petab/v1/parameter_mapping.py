@@ -58,6 +58,9 @@ ParMappingDictQuadruple = tuple[
     ParMappingDict, ParMappingDict, ScaleMappingDict, ScaleMappingDict
 ]
 
+# Placeholder output parameters from the observable table
+_output_parameter_pattern = re.compile("^(noise|observable)Parameter[0-9]+_")
+
 
 def get_optimization_to_simulation_parameter_mapping(
     condition_df: pd.DataFrame,
@@ -436,10 +439,9 @@ def get_parameter_mapping_for_condition(
 
 def _output_parameters_to_nan(mapping: ParMappingDict) -> None:
     """Set output parameters in mapping dictionary to nan"""
-    rex = re.compile("^(noise|observable)Parameter[0-9]+_")
     for key in mapping.keys():
         try:
-            matches = rex.match(key)
+            matches = _output_parameter_pattern.match(key)
         except TypeError:
             continue
 
@@ -663,10 +665,9 @@ def handle_missing_overrides(
             Optional condition ID for more informative output
     """
     _missed_vals = []
-    rex = re.compile("^(noise|observable)Parameter[0-9]+_")
     for key, val in mapping_par_opt_to_par_sim.items():
         try:
-            matches = rex.match(val)
+            matches = _output_parameter_pattern.match(val)
         except TypeError:
             continue
 
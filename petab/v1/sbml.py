@@ -1,7 +1,8 @@
 """Functions for interacting with SBML models"""
 
-import contextlib
 import logging
+import os
+from functools import cache
 from numbers import Number
 from pathlib import Path
 from warnings import warn
@@ -24,6 +25,16 @@ __all__ = [
     "write_sbml",
 ]
 
+# Performance note: the functions in this module spend their time calling
+#  into libSBML and in per-component Python dispatch, not in numerical
+#  loops. libSBML's ID-based getters search the model linearly, so where
+#  many components are looked up, the relevant `ListOf*` containers are
+#  indexed in dicts or sets once per call (see `get_model_for_condition`).
+#  Avoid iterating `getListOfAllElements()`, which is quadratic in the
+#  model size, and don't keep such indexes across calls, since models are
+#  modified in place. Vectorizing with pandas does not pay off for the few
+#  values per condition handled here.
+
 
 def is_sbml_consistent(
     sbml_document: libsbml.SBMLDocument,
@@ -116,12 +127,16 @@ def globalize_parameters(
     for reaction in sbml_model.getListOfReactions():
         law = reaction.getKineticLaw()
         # copy first so we can delete in the following loop
-        local_parameters = list(law.getListOfParameters())
+        local_parameters = [
+            law.getParameter(i) for i in range(law.getNumParameters())
+        ]
+        reaction_id = reaction.getId()
         for lp in local_parameters:
+            lp_id = lp.getId()
             if prepend_reaction_id:
-                parameter_id = f"{reaction.getId()}_{lp.getId()}"
+                parameter_id = f"{reaction_id}_{lp_id}"
             else:
-                parameter_id = lp.getId()
+                parameter_id = lp_id
 
             # Create global
             p = sbml_model.createParameter()
@@ -132,7 +147,7 @@ def globalize_parameters(
             p.setUnits(lp.getUnits())
 
             # removeParameter, not removeLocalParameter!
-            law.removeParameter(lp.getId())
+            law.removeParameter(lp_id)
 
 
 def get_model_parameters(
@@ -148,30 +163,34 @@ def get_model_parameters(
             parameter IDs as keys and parameter values from the SBML model as
             values.
     """
+    rule_targets = {rule.getVariable() for rule in sbml_model.getListOfRules()}
+
     if not with_values:
         return [
             p.getId()
             for p in sbml_model.getListOfParameters()
-            if sbml_model.getRuleByVariable(p.getId()) is None
+            if p.getId() not in rule_targets
         ]
 
     return {
         p.getId(): p.getValue()
         for p in sbml_model.getListOfParameters()
-        if sbml_model.getRuleByVariable(p.getId()) is None
+        if p.getId() not in rule_targets
     }
 
 
 def write_sbml(sbml_doc: libsbml.SBMLDocument, filename: Path | str) -> None:
-    """Write PEtab visualization table
+    """Write SBML model to file
 
     Arguments:
         sbml_doc: SBML document containing the SBML model
-        filename: Destination file name
+        filename: Destination file name. If it ends with ``.gz``, ``.bz2``
+            or ``.zip``, libSBML writes a compressed file.
     """
+    filename = os.fspath(filename)
     Path(filename).parent.mkdir(parents=True, exist_ok=True)
     sbml_writer = libsbml.SBMLWriter()
-    ret = sbml_writer.writeSBMLToFile(sbml_doc, str(filename))
+    ret = sbml_writer.writeSBMLToFile(sbml_doc, filename)
     if not ret:
         raise RuntimeError(
             f"libSBML reported error {ret} when trying to "
@@ -188,9 +207,13 @@ def get_sbml_model(
         File or URL or file handle to read the model from
     :return: The SBML document, model and reader
     """
+    if isinstance(filepath_or_buffer, os.PathLike):
+        # local path, no need to probe for URLs or file handles
+        return load_sbml_from_file(os.fspath(filepath_or_buffer))
+
     if is_file_like(filepath_or_buffer) or is_url(filepath_or_buffer):
         with get_handle(filepath_or_buffer, mode="r") as io_handle:
-            data = load_sbml_from_string("".join(io_handle.handle))
+            data = load_sbml_from_string(io_handle.handle.read())
         # URL or already opened file, we will load the model from a string
         return data
 
@@ -287,58 +310,86 @@ def get_model_for_condition(
     sbml_doc = petab_problem.model.sbml_model.getSBMLDocument().clone()
     sbml_model = sbml_doc.getModel()
 
+    # index the relevant model components once, instead of searching the
+    #  model for each parameter and condition table column
+    species_by_id = {s.getId(): s for s in sbml_model.getListOfSpecies()}
+    compartments_by_id = {
+        c.getId(): c for c in sbml_model.getListOfCompartments()
+    }
+    rule_targets = {rule.getVariable() for rule in sbml_model.getListOfRules()}
+    initial_assignment_targets = {
+        ia.getSymbol() for ia in sbml_model.getListOfInitialAssignments()
+    }
+
+    # nominal values are optional in the parameter table
+    nominal_values = (
+        petab_problem.parameter_df[petab.NOMINAL_VALUE].to_dict()
+        if petab_problem.parameter_df is not None
+        and petab.NOMINAL_VALUE in petab_problem.parameter_df
+        else {}
+    )
+
     # fill in parameters
+    @cache
     def get_param_value(parameter_id: str):
         """Parameter value from mapping or nominal value"""
         mapped_value = parameter_map.get(parameter_id)
         if mapped_value is None:
             # Handle parametric initial concentrations
-            with contextlib.suppress(KeyError):
-                return petab_problem.parameter_df.loc[
-                    parameter_id, petab.NOMINAL_VALUE
-                ]
+            return nominal_values.get(parameter_id)
 
         if not isinstance(mapped_value, str):
             return mapped_value
 
         # estimated parameter, look up in nominal parameters
-        return petab_problem.parameter_df.loc[
-            mapped_value, petab.NOMINAL_VALUE
-        ]
+        return nominal_values[mapped_value]
 
     def remove_rules(target_id: str):
-        if sbml_model.removeRuleByVariable(target_id):
-            warn(
-                "An SBML rule was removed to set the component "
-                f"{target_id} to a constant value.",
-                stacklevel=2,
-            )
-        sbml_model.removeInitialAssignment(target_id)
+        if target_id in rule_targets:
+            rule_targets.discard(target_id)
+            if sbml_model.removeRuleByVariable(target_id):
+                warn(
+                    "An SBML rule was removed to set the component "
+                    f"{target_id} to a constant value.",
+                    stacklevel=2,
+                )
+        if target_id in initial_assignment_targets:
+            initial_assignment_targets.discard(target_id)
+            sbml_model.removeInitialAssignment(target_id)
 
     for parameter in sbml_model.getListOfParameters():
-        new_value = get_param_value(parameter.getId())
-        if new_value:
+        parameter_id = parameter.getId()
+        new_value = get_param_value(parameter_id)
+        if new_value is not None:
             parameter.setValue(new_value)
             # remove rules that would override that value
-            remove_rules(parameter.getId())
-
-    # set concentrations for any overridden species
-    for component_id in petab_problem.condition_df:
-        sbml_species = sbml_model.getSpecies(component_id)
-        if not sbml_species:
-            continue
-
-        # remove any rules overriding that species' initials
+            remove_rules(parameter_id)
+
+    # set initial concentrations/amounts of species and sizes of
+    #  compartments that are overridden in the condition table
+    component_ids = [
+        component_id
+        for component_id in petab_problem.condition_df
+        if component_id in species_by_id or component_id in compartments_by_id
+    ]
+    if not component_ids:
+        return sbml_doc, sbml_model
+
+    condition = petab_problem.condition_df.loc[sim_condition_id, component_ids]
+    for component_id, value in condition.items():
+        # remove any rules overriding that component's initial value
         remove_rules(component_id)
 
-        # set initial concentration/amount
-        new_value = petab.to_float_if_float(
-            petab_problem.condition_df.loc[sim_condition_id, component_id]
-        )
+        new_value = petab.to_float_if_float(value)
         if not isinstance(new_value, Number):
             # parameter reference in condition table
             new_value = get_param_value(new_value)
 
+        if sbml_compartment := compartments_by_id.get(component_id):
+            sbml_compartment.setSize(new_value)
+            continue
+
+        sbml_species = species_by_id[component_id]
         if sbml_species.isSetInitialAmount() or (
             sbml_species.getHasOnlySubstanceUnits()
             and not sbml_species.isSetInitialConcentration()
@@ -347,23 +398,4 @@ def get_model_for_condition(
         else:
             sbml_species.setInitialConcentration(new_value)
 
-    # set compartment size for any compartments in the condition table
-    for component_id in petab_problem.condition_df:
-        sbml_compartment = sbml_model.getCompartment(component_id)
-        if not sbml_compartment:
-            continue
-
-        # remove any rules overriding that compartment's size
-        remove_rules(component_id)
-
-        # set initial concentration/amount
-        new_value = petab.to_float_if_float(
-            petab_problem.condition_df.loc[sim_condition_id, component_id]
-        )
-        if not isinstance(new_value, Number):
-            # parameter reference in condition table
-            new_value = get_param_value(new_value)
-
-        sbml_compartment.setSize(new_value)
-
     return sbml_doc, sbml_model
@@ -1,5 +1,7 @@
 """Test related to petab.models.model_pysb"""
 
+import sys
+
 import pysb
 import pytest
 
@@ -94,3 +96,87 @@ def test_pysb_model_repr(uses_pysb):
     model = pysb.Model(name="test")
     petab_model = PySBModel(model)
     assert repr(petab_model) == "<PySBModel 'test'>"
+
+
+def test_pysb_model_from_file_independent(uses_pysb, tmp_path):
+    model_file = tmp_path / "independent_model.py"
+    model_file.write_text(
+        "from pysb import Model, Parameter\nModel()\nParameter('k1', 1.0)\n"
+    )
+
+    petab_model1 = PySBModel.from_file(model_file)
+    petab_model1.model.parameters["k1"].value = 42
+    petab_model1.model.add_component(pysb.Parameter("k2", _export=False))
+
+    # every load returns a fresh model
+    petab_model2 = PySBModel.from_file(model_file)
+    assert petab_model2.model is not petab_model1.model
+    assert petab_model2.get_parameter_value("k1") == 1.0
+    assert not petab_model2.has_entity_with_id("k2")
+
+
+def test_pysb_model_has_entity_with_id(uses_pysb):
+    model = pysb.Model()
+    pysb.Compartment("c1")
+    pysb.Monomer("A")
+    pysb.Parameter("k1", 1.0)
+    petab_model = PySBModel(model=model, model_id="test_model")
+
+    assert petab_model.has_entity_with_id("c1")
+    assert petab_model.has_entity_with_id("A")
+    assert petab_model.has_entity_with_id("k1")
+    assert not petab_model.has_entity_with_id("k2")
+
+    # lookups reflect changes to the model
+    pysb.Parameter("k2", 2.0)
+    assert petab_model.has_entity_with_id("k2")
+
+    model.parameters["k1"].rename("k3")
+    assert petab_model.has_entity_with_id("k3")
+    assert not petab_model.has_entity_with_id("k1")
+
+
+def test_pysb_model_get_parameter_value(uses_pysb):
+    model = pysb.Model()
+    pysb.Parameter("k1", 1.5)
+    petab_model = PySBModel(model=model, model_id="test_model")
+
+    assert petab_model.get_parameter_value("k1") == 1.5
+    assert petab_model.get_parameter_ids() == ("k1",)
+    assert petab_model.get_free_parameter_ids_with_values() == (("k1", 1.5),)
+    assert petab_model.get_parameter_ids_with_values() == (("k1", 1.5),)
+    with pytest.raises(ValueError, match="does not exist"):
+        petab_model.get_parameter_value("k2")
+
+    # values are not cached
+    model.parameters["k1"].value = 2.5
+    assert petab_model.get_parameter_value("k1") == 2.5
+
+
+def test_pysb_model_symbol_allowed_in_observable_formula(uses_pysb):
+    model = pysb.Model()
+    A = pysb.Monomer("A")
+    pysb.Parameter("k1", 1.0)
+    pysb.Observable("obs_A", A())
+    petab_model = PySBModel(model=model, model_id="test_model")
+
+    assert petab_model.symbol_allowed_in_observable_formula("k1")
+    assert petab_model.symbol_allowed_in_observable_formula("obs_A")
+    assert not petab_model.symbol_allowed_in_observable_formula("A")
+    assert not petab_model.symbol_allowed_in_observable_formula("expr")
+
+    pysb.Expression("expr", model.parameters["k1"] * 2)
+    assert petab_model.symbol_allowed_in_observable_formula("expr")
+
+    model.parameters["k1"].rename("k2")
+    assert petab_model.symbol_allowed_in_observable_formula("k2")
+    assert not petab_model.symbol_allowed_in_observable_formula("k1")
+
+
+def test_pysb_model_from_file_error(uses_pysb, tmp_path):
+    model_file = tmp_path / "broken_model.py"
+    model_file.write_text("from pysb import Model\nModel()\n1 / 0\n")
+
+    with pytest.raises(ZeroDivisionError):
+        PySBModel.from_file(model_file)
+    assert "broken_model" not in sys.modules
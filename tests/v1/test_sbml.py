@@ -1,5 +1,6 @@
 import os
 import sys
+from copy import deepcopy
 
 import libsbml
 import pandas as pd
@@ -126,6 +127,80 @@ def test_get_condition_specific_models():
     check_model(condition_model)
 
 
+def test_get_model_for_condition_zero_override():
+    """Zero-valued condition overrides must not be dropped"""
+    (
+        model,
+        condition_df,
+        observable_df,
+        measurement_df,
+        parameter_df,
+    ) = create_test_data()
+    condition_df["parameter_3"] = [0]
+
+    petab_problem = petab.Problem(
+        model=model,
+        condition_df=condition_df,
+        observable_df=observable_df,
+        measurement_df=measurement_df,
+        parameter_df=parameter_df,
+    )
+
+    with pytest.warns(UserWarning, match="An SBML rule was removed"):
+        _, condition_model = petab.get_model_for_condition(
+            petab_problem, "condition_1"
+        )
+
+    assert condition_model.getParameter("parameter_3").getValue() == 0.0
+
+
+def test_get_model_for_condition_without_nominal_values():
+    """The nominalValue column is optional"""
+    model = SbmlModel.from_antimony("species S1 = 1; k1 = 1; S1' = -k1 * S1")
+    condition_df = pd.DataFrame(
+        {petab.CONDITION_ID: ["condition_1"], "k1": [0.3]}
+    ).set_index(petab.CONDITION_ID)
+    observable_df = pd.DataFrame(
+        {
+            petab.OBSERVABLE_ID: ["observable_1"],
+            petab.OBSERVABLE_FORMULA: ["S1"],
+            petab.NOISE_FORMULA: ["sd"],
+        }
+    ).set_index(petab.OBSERVABLE_ID)
+    measurement_df = pd.DataFrame(
+        {
+            petab.OBSERVABLE_ID: ["observable_1"],
+            petab.SIMULATION_CONDITION_ID: ["condition_1"],
+            petab.TIME: [1.0],
+            petab.MEASUREMENT: [0.5],
+        }
+    )
+    parameter_df = pd.DataFrame(
+        {
+            petab.PARAMETER_ID: ["sd"],
+            petab.PARAMETER_SCALE: [petab.LIN],
+            petab.LOWER_BOUND: [0.1],
+            petab.UPPER_BOUND: [10.0],
+            petab.ESTIMATE: [1],
+        }
+    ).set_index(petab.PARAMETER_ID)
+
+    petab_problem = petab.Problem(
+        model=model,
+        condition_df=condition_df,
+        observable_df=observable_df,
+        measurement_df=measurement_df,
+        parameter_df=parameter_df,
+    )
+    assert not petab.lint_problem(petab_problem)
+
+    _, condition_model = petab.get_model_for_condition(
+        petab_problem, "condition_1"
+    )
+
+    assert condition_model.getParameter("k1").getValue() == 0.3
+
+
 def test_sbml_model_repr():
     sbml_document = libsbml.SBMLDocument()
     sbml_model = sbml_document.createModel()
@@ -150,3 +225,91 @@ def test_sbml_from_to_ant():
 
     # convert back to antimony
     assert "R1: S1 -> S2; k1*S1" in petab_model.to_antimony()
+
+
+def test_sbml_model_entity_lookup():
+    petab_model = SbmlModel.from_antimony(
+        "compartment c1 = 1; species S1 in c1 = 1; k1 = 1; k2 := 2 * k1"
+    )
+    assert petab_model.has_entity_with_id("S1")
+    assert petab_model.has_entity_with_id("k2")
+    assert not petab_model.has_entity_with_id("S2")
+    assert petab_model.symbol_allowed_in_observable_formula("k1")
+    assert petab_model.symbol_allowed_in_observable_formula("time")
+    assert not petab_model.symbol_allowed_in_observable_formula("S2")
+    assert petab_model.is_state_variable("S1")
+    assert petab_model.is_state_variable("c1")
+    assert petab_model.is_state_variable("k2")
+    assert not petab_model.is_state_variable("k1")
+    assert petab_model.get_parameter_ids() == ("k1",)
+    assert petab_model.get_parameter_ids_with_values() == (("k1", 1.0),)
+    assert tuple(petab_model.get_valid_parameters_for_parameter_table()) == (
+        "k1",
+    )
+
+    # lookups reflect changes to the model
+    parameter = petab_model.sbml_model.createParameter()
+    parameter.setId("k3")
+    assert tuple(petab_model.get_valid_parameters_for_parameter_table()) == (
+        "k1",
+        "k3",
+    )
+    species = petab_model.sbml_model.createSpecies()
+    species.setId("S2")
+    species.setCompartment("c1")
+    assert petab_model.has_entity_with_id("S2")
+    assert petab_model.is_state_variable("S2")
+    petab_model.sbml_model.removeSpecies("S1")
+    assert not petab_model.has_entity_with_id("S1")
+    assert not petab_model.is_state_variable("S1")
+
+    # changes that keep the number of components
+    petab_model.sbml_model.getParameter("k1").setId("kX")
+    assert petab_model.has_entity_with_id("kX")
+    assert not petab_model.has_entity_with_id("k1")
+    petab_model.sbml_model.removeSpecies("S2")
+    species = petab_model.sbml_model.createSpecies()
+    species.setId("S9")
+    species.setCompartment("c1")
+    assert petab_model.is_state_variable("S9")
+    assert not petab_model.has_entity_with_id("S2")
+
+
+def test_sbml_model_parameter_ids_follow_model_changes():
+    petab_model = SbmlModel.from_antimony("k1 = 1; k2 := 2 * k1")
+    assert petab_model.get_valid_parameters_for_parameter_table() == ("k1",)
+
+    # the number of parameters is unchanged, but the IDs are not
+    petab_model.sbml_model.getParameter("k1").setId("kX")
+    assert petab_model.get_parameter_ids() == ("kX",)
+    assert petab_model.get_valid_parameters_for_parameter_table() == ("kX",)
+    assert petab_model.get_parameter_ids_with_values() == (("kX", 1.0),)
+
+    # rule targets are looked up in the live model as well
+    petab_model.sbml_model.getRule(0).setVariable("kX")
+    assert petab_model.get_parameter_ids() == ("k2",)
+
+
+def test_sbml_model_deepcopy():
+    petab_model = SbmlModel.from_antimony("k1 = 1")
+    petab_model_copy = deepcopy(petab_model)
+
+    assert petab_model_copy.to_sbml_str() == petab_model.to_sbml_str()
+    assert petab_model_copy.model_id == petab_model.model_id
+    assert isinstance(petab_model_copy.sbml_reader, libsbml.SBMLReader)
+
+    # the copy is independent of the original
+    petab_model_copy.sbml_model.getParameter("k1").setValue(2)
+    assert petab_model.get_parameter_value("k1") == 1
+    assert petab_model_copy.get_parameter_value("k1") == 2
+
+
+def test_sbml_model_free_parameters():
+    petab_model = SbmlModel.from_antimony(
+        "k1 = 1; k2 = 2 * 3; k3 = 2 * k1; k4 := k1"
+    )
+    # k3 has a non-numeric initial assignment, k4 is a rule target
+    assert petab_model.get_free_parameter_ids_with_values() == (
+        ("k1", 1.0),
+        ("k2", 6.0),
+    )